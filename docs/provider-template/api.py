@@ -70,5 +70,7 @@ class Provider(BaseProvider):
 
     def _build_zone_validity(self) -> list[ZoneValidityBlock]:
         """Example helper for zone validity filtering."""
+        # Append one (block, is_chargeable) pair per provider window while parsing; the
+        # base class drops free windows and normalizes timestamps in a single pass.
         entries: list[tuple[ZoneValidityBlock, bool]] = []
         return self._filter_chargeable_zone_validity(entries)
@@ -26,7 +26,7 @@ When --sanitize-output is enabled, the script avoids printing full license plate
 Debug helpers:
   --debug-http prints request/response summaries (sanitized with --sanitize-output).
   --dump-json prints request/response JSON payloads (sanitized with --sanitize-output).
-  --dump-dir writes request/response JSON to a single run file
+  --dump-dir appends request/response JSON to a single NDJSON run file
               (sanitized with --sanitize-output).
   --traceback prints full tracebacks on errors.
   --sanitize-output sanitizes privacy-sensitive output.
@@ -46,17 +46,20 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import importlib
 import json
 import logging
 import os
 import sys
 import time
 import traceback
-from collections.abc import Mapping
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal
-from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from typing import TYPE_CHECKING, Any, Literal, TextIO
 
 import aiohttp
 from sanitize import mask_license_plate as _mask_license_plate
@@ -67,8 +70,22 @@ from pycityvisitorparking import Client
 from pycityvisitorparking.exceptions import ProviderError, ValidationError
 from pycityvisitorparking.models import Favorite, Reservation
 
+# orjson is an optional speedup; both parsers accept bytes and raise ValueError
+# subclasses on malformed input.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+if TYPE_CHECKING:
+    from zoneinfo import ZoneInfo
+
 _LOGGER = logging.getLogger(__name__)
 _TEXT_TRUNCATE = 2000
+_JSON_SCALARS = (str, int, float, type(None))
+_ONE_DAY = timedelta(days=1)
+_ONE_HOUR = timedelta(hours=1)
 _ANSI_STYLES = {
     "reset": "\x1b[0m",
     "bold": "\x1b[1m",
@@ -79,8 +96,34 @@ _ANSI_STYLES = {
     "cyan": "\x1b[36m",
     "magenta": "\x1b[35m",
 }
-_COLOR_ENABLED = False
 _ERROR_REPORTED = False
+# Set inside each flow task so lines from concurrent flows can be told apart.
+_LINE_PREFIX: ContextVar[str] = ContextVar("line_prefix", default="")
+# CLI attributes that fall back to environment variables when not passed explicitly.
+_ENV_FALLBACKS = (
+    ("provider_id", "PROVIDER_ID"),
+    ("base_url", "BASE_URL"),
+    ("api_uri", "API_URI"),
+    ("credentials_json", "CREDENTIALS_JSON"),
+    ("credentials_file", "CREDENTIALS_FILE"),
+    ("username", "USERNAME"),
+    ("password", "PASSWORD"),
+    ("license_plate", "LICENSE_PLATE"),
+)
+# Byte values dropped when normalizing plates for comparison (everything except A-Z/a-z/0-9).
+_PLATE_DELETE_BYTES = bytes(
+    code for code in range(256) if not (chr(code).isascii() and chr(code).isalnum())
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _RunConfig:
+    color: bool
+    traceback: bool
+    debug: bool
+    sanitize: bool
+    post_create_wait: int
+    verify_after_create: bool
 
 
 def _require_value(name: str, value: str | None) -> str:
@@ -90,8 +133,8 @@ def _require_value(name: str, value: str | None) -> str:
     return value
 
 
-def _style(text: str, color: str | None = None, *, bold: bool = False) -> str:
-    if not _COLOR_ENABLED or not color:
+def _style(text: str, color: str | None, *, enabled: bool, bold: bool = False) -> str:
+    if not enabled or not color:
         return text
     color_code = _ANSI_STYLES.get(color)
     if not color_code:
@@ -100,8 +143,32 @@ def _style(text: str, color: str | None = None, *, bold: bool = False) -> str:
     return f"{prefix}{color_code}{text}{_ANSI_STYLES['reset']}"
 
 
-def _format_action(label: str, value: str, *, color: str | None = None) -> str:
-    return f"{_style(label, color, bold=True)}: {value}"
+# Action labels repeat across flows, so each styled prefix is built once per
+# (label, color, enabled) and reused.
+@lru_cache(maxsize=64)
+def _action_prefix(label: str, color: str | None, enabled: bool) -> str:
+    return f"{_style(label, color, enabled=enabled, bold=True)}: "
+
+
+def _format_action(
+    label: str,
+    value: str,
+    *,
+    config: _RunConfig,
+    color: str | None = None,
+) -> str:
+    return _action_prefix(label, color, config.color) + value
+
+
+def _write_lines(lines: list[str], stream: TextIO | None = None) -> None:
+    # Emit a block of lines with a single write instead of one print per line.
+    if lines:
+        prefix = _LINE_PREFIX.get()
+        (stream or sys.stdout).write("".join(f"{prefix}{line}\n" for line in lines))
+
+
+def _print_line(text: str, stream: TextIO | None = None) -> None:
+    _write_lines([text], stream)
 
 
 def _truncate_text(value: str, limit: int) -> str:
@@ -110,12 +177,31 @@ def _truncate_text(value: str, limit: int) -> str:
     return f"{value[:limit]}... [truncated]"
 
 
+def _copy_headers(headers: Mapping[str, Any]) -> dict[str, Any]:
+    # Header maps are flat str -> str (CIMultiDict or dict), so a C-level copy
+    # replaces the recursive walk; items() keeps the last value for repeated names.
+    return dict(headers.items())
+
+
+def _dump_json(payload: Any, *, pretty: bool = False) -> str:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(payload, option=option).decode("utf-8")
+    if pretty:
+        return json.dumps(payload, indent=2, sort_keys=True)
+    return json.dumps(payload, separators=(",", ":"))
+
+
 def _normalize_debug_value(value: Any) -> Any:
+    # JSON scalars are most of any payload tree; return them before the slower
+    # ABC Mapping check so pure JSON bodies are walked with minimal overhead.
+    if isinstance(value, _JSON_SCALARS):
+        return value
     if isinstance(value, Mapping):
         return {str(k): _normalize_debug_value(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_normalize_debug_value(item) for item in value]
-    if isinstance(value, tuple):
+    if isinstance(value, (list, tuple)):
         return [_normalize_debug_value(item) for item in value]
     if isinstance(value, datetime):
         return value.isoformat()
@@ -126,45 +212,49 @@ def _normalize_debug_value(value: Any) -> Any:
     return value
 
 
-def _print_exception(label: str, exc: Exception, *, trace: bool) -> None:
+def _print_exception(label: str, exc: Exception, *, config: _RunConfig) -> None:
     global _ERROR_REPORTED
-    styled_label = _style(label, "red", bold=True)
-    print(f"{styled_label}: {exc.__class__.__name__}: {exc}", file=sys.stderr)
+    styled_label = _style(label, "red", enabled=config.color, bold=True)
+    _print_line(f"{styled_label}: {exc.__class__.__name__}: {exc}", sys.stderr)
     _ERROR_REPORTED = True
-    if trace:
-        traceback.print_exc()
+    if config.traceback:
+        _write_lines("".join(traceback.format_exception(exc)).rstrip("\n").splitlines(), sys.stderr)
 
 
-def _log_step_start(label: str) -> float:
-    print(_style(f"[STEP] {label}...", "blue", bold=True), file=sys.stderr)
-    return time.monotonic()
+def _log_step_start(label: str, *, config: _RunConfig) -> int:
+    _print_line(_style(f"[STEP] {label}...", "blue", enabled=config.color, bold=True), sys.stderr)
+    return time.monotonic_ns()
 
 
-def _log_step_done(label: str, started_at: float) -> None:
-    elapsed_ms = int((time.monotonic() - started_at) * 1000)
-    print(_style(f"[STEP] {label} ok ({elapsed_ms}ms)", "green", bold=True), file=sys.stderr)
+def _log_step_done(label: str, started_at: int, *, config: _RunConfig) -> None:
+    elapsed_ms = (time.monotonic_ns() - started_at) // 1_000_000
+    text = f"[STEP] {label} ok ({elapsed_ms}ms)"
+    _print_line(_style(text, "green", enabled=config.color, bold=True), sys.stderr)
 
 
-def _log_step_abort(label: str, reason: str | None = None) -> None:
+def _log_step_abort(label: str, reason: str | None = None, *, config: _RunConfig) -> None:
     suffix = f" ({reason})" if reason else ""
-    print(_style(f"[STEP] {label} aborted{suffix}", "yellow", bold=True), file=sys.stderr)
+    text = f"[STEP] {label} aborted{suffix}"
+    _print_line(_style(text, "yellow", enabled=config.color, bold=True), sys.stderr)
 
 
-async def _run_step(label: str, coro: Any, *, trace: bool) -> Any:
-    started_at = _log_step_start(label)
+async def _run_step(label: str, coro: Any, *, config: _RunConfig) -> Any:
+    started_at = _log_step_start(label, config=config)
     try:
         result = await coro
     except Exception as exc:
-        _print_exception(f"{label} failed", exc, trace=trace)
+        _print_exception(f"{label} failed", exc, config=config)
         raise
-    _log_step_done(label, started_at)
+    _log_step_done(label, started_at, config=config)
     return result
 
 
 def _normalize_plate_for_compare(value: str) -> str:
     if not isinstance(value, str):
         return ""
-    return "".join(ch for ch in value.upper() if ch.isascii() and ch.isalnum())
+    # Drop non-ASCII characters, then delete the remaining non-alphanumerics in one pass.
+    encoded = value.upper().encode("ascii", "ignore")
+    return encoded.translate(None, _PLATE_DELETE_BYTES).decode("ascii")
 
 
 def _build_favorite_name(license_plate: str, favorite_name: str | None) -> str:
@@ -181,8 +271,8 @@ def _build_favorite_name(license_plate: str, favorite_name: str | None) -> str:
 def _load_credentials(raw_json: str | None, file_path: str | None) -> dict[str, Any]:
     if raw_json:
         try:
-            data = json.loads(raw_json)
-        except json.JSONDecodeError as exc:
+            data = _json_loads(raw_json)
+        except ValueError as exc:
             print(f"Invalid credentials JSON: {exc}", file=sys.stderr)
             raise SystemExit(2) from exc
         if not isinstance(data, dict):
@@ -191,12 +281,12 @@ def _load_credentials(raw_json: str | None, file_path: str | None) -> dict[str,
         return data
     if file_path:
         path = Path(file_path)
-        if not path.exists():
-            print(f"Credentials file not found: {path}", file=sys.stderr)
-            raise SystemExit(2)
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
+            data = _json_loads(path.read_bytes())
+        except FileNotFoundError as exc:
+            print(f"Credentials file not found: {path}", file=sys.stderr)
+            raise SystemExit(2) from exc
+        except ValueError as exc:
             print(f"Invalid credentials JSON file: {exc}", file=sys.stderr)
             raise SystemExit(2) from exc
         if not isinstance(data, dict):
@@ -207,31 +297,36 @@ def _load_credentials(raw_json: str | None, file_path: str | None) -> dict[str,
     raise SystemExit(2)
 
 
+# Plates repeat across the before/after listings, so masks are memoized per raw
+# plate. The cache lives only for this short script run and never leaves the process.
+@lru_cache(maxsize=1024)
+def _masked_plate(plate: str) -> str:
+    return _mask_license_plate(plate)
+
+
 def _format_reservation(reservation: Reservation, *, sanitize: bool = False) -> str:
-    data = {
-        "id": reservation.id,
-        "name": reservation.name or "-",
-        "license_plate": reservation.license_plate,
-        "start_time": reservation.start_time,
-        "end_time": reservation.end_time,
-    }
+    reservation_id = reservation.id
+    name = reservation.name or "-"
+    plate = reservation.license_plate
     if sanitize:
-        data = _sanitize_data(data)
+        # Only the sanitized path needs the dict that sanitize_data walks.
+        data = _sanitize_data({"id": reservation_id, "name": name})
+        reservation_id, name = data["id"], data["name"]
+        plate = _masked_plate(plate)
     return (
-        f"{data['id']} | {data['name']} | {data['license_plate']} | "
-        f"{data['start_time']} -> {data['end_time']}"
+        f"{reservation_id} | {name} | {plate} | {reservation.start_time} -> {reservation.end_time}"
     )
 
 
 def _format_favorite(favorite: Favorite, *, sanitize: bool = False) -> str:
-    data = {
-        "id": favorite.id,
-        "name": favorite.name or "-",
-        "license_plate": favorite.license_plate,
-    }
+    favorite_id = favorite.id
+    name = favorite.name or "-"
+    plate = favorite.license_plate
     if sanitize:
-        data = _sanitize_data(data)
-    return f"{data['id']} | {data['name']} | {data['license_plate']}"
+        data = _sanitize_data({"id": favorite_id, "name": name})
+        favorite_id, name = data["id"], data["name"]
+        plate = _masked_plate(plate)
+    return f"{favorite_id} | {name} | {plate}"
 
 
 class _DebugRecorder:
@@ -242,21 +337,34 @@ class _DebugRecorder:
         dump_json: bool,
         dump_dir: Path | None,
         max_text: int,
-        sanitize_output: bool,
+        config: _RunConfig,
     ) -> None:
         self._enabled = enabled
         self._dump_json = dump_json
         self._dump_dir = dump_dir
         self._max_text = max_text
-        self._sanitize_output = sanitize_output
+        self._sanitize_output = config.sanitize
         self._counter = 0
         self._run_id = time.strftime("%Y%m%d-%H%M%S")
         if dump_dir:
             self._run_id = f"{self._run_id}-{os.getpid()}"
-        self._requests: dict[str, dict[str, Any]] = {}
-        self._run_entries: dict[str, dict[str, Any]] = {}
+        # Indexed by request number - 1; numbers are handed out sequentially.
+        self._requests: list[dict[str, Any]] = []
+        self._dump_file: TextIO | None = None
         if self._dump_dir:
             self._dump_dir.mkdir(parents=True, exist_ok=True)
+            # Open the run file once and append one NDJSON line per event.
+            self._dump_file = (self._dump_dir / f"{self._run_id}.ndjson").open(
+                "a",
+                buffering=1 << 16,
+                encoding="utf-8",
+            )
+        # JSON encoding and file IO run on a background task, off the request path.
+        self._queue: asyncio.Queue[tuple[str, str, dict[str, Any]] | None] | None = None
+        self._worker: asyncio.Task[None] | None = None
+        if self._dump_json or self._dump_file:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._drain(self._queue))
 
     def start_request(
         self,
@@ -267,8 +375,14 @@ class _DebugRecorder:
         params: Mapping[str, Any] | None,
         json_payload: Any | None,
         data_payload: Any | None,
-    ) -> str:
+    ) -> int:
         self._counter += 1
+        if self._queue is None:
+            # Only the one-line summary is printed, so skip copying the payloads.
+            self._requests.append({"started_at": time.monotonic_ns()})
+            if self._enabled:
+                _print_line(f"[HTTP] -> {method} {url}", sys.stderr)
+            return self._counter
         request_id = f"{self._counter:04d}"
         if self._sanitize_output:
             headers_value = _sanitize_headers(headers)
@@ -276,7 +390,7 @@ class _DebugRecorder:
             json_value = _sanitize_data(json_payload) if json_payload is not None else None
             data_value = _sanitize_data(data_payload) if data_payload is not None else None
         else:
-            headers_value = _normalize_debug_value(headers)
+            headers_value = _copy_headers(headers)
             params_value = _normalize_debug_value(params) if params else None
             json_value = _normalize_debug_value(json_payload) if json_payload is not None else None
             data_value = _normalize_debug_value(data_payload) if data_payload is not None else None
@@ -288,19 +402,17 @@ class _DebugRecorder:
             "params": params_value,
             "json": json_value,
             "data": data_value,
-            "started_at": time.monotonic(),
+            "started_at": time.monotonic_ns(),
         }
-        self._requests[request_id] = entry
+        self._requests.append(entry)
         if self._enabled:
-            print(f"[HTTP] -> {method} {url}", file=sys.stderr)
-        if self._dump_json:
-            self._print_json(request_id, "request", entry)
-        self._write_dump(request_id, "request", entry)
-        return request_id
+            _print_line(f"[HTTP] -> {method} {url}", sys.stderr)
+        self._emit(request_id, "request", entry)
+        return self._counter
 
     def record_response(
         self,
-        request_id: str,
+        request_number: int,
         *,
         status: int,
         headers: Mapping[str, Any],
@@ -308,16 +420,23 @@ class _DebugRecorder:
         text_body: str | None = None,
         error: Exception | None = None,
     ) -> None:
-        entry = self._requests.get(request_id, {})
+        entry = self._requests[request_number - 1] if request_number > 0 else {}
         elapsed_ms = None
         if "started_at" in entry:
-            elapsed_ms = int((time.monotonic() - entry["started_at"]) * 1000)
+            elapsed_ms = (time.monotonic_ns() - entry["started_at"]) // 1_000_000
+        if self._enabled:
+            status_text = f"{status}" if status is not None else "unknown"
+            duration = f"{elapsed_ms}ms" if elapsed_ms is not None else "n/a"
+            _print_line(f"[HTTP] <- {status_text} ({duration})", sys.stderr)
+        if self._queue is None:
+            return
         if self._sanitize_output:
             headers_value = _sanitize_headers(headers)
             json_value = _sanitize_data(json_body) if json_body is not None else None
         else:
-            headers_value = _normalize_debug_value(headers)
+            headers_value = _copy_headers(headers)
             json_value = _normalize_debug_value(json_body) if json_body is not None else None
+        request_id = f"{request_number:04d}"
         response_entry = {
             "id": request_id,
             "status": status,
@@ -327,47 +446,67 @@ class _DebugRecorder:
             "text": _truncate_text(text_body, self._max_text) if text_body else None,
             "error": f"{error.__class__.__name__}: {error}" if error else None,
         }
-        if self._enabled:
-            status_text = f"{status}" if status is not None else "unknown"
-            duration = f"{elapsed_ms}ms" if elapsed_ms is not None else "n/a"
-            print(f"[HTTP] <- {status_text} ({duration})", file=sys.stderr)
-        if self._dump_json:
-            self._print_json(request_id, "response", response_entry)
-        self._write_dump(request_id, "response", response_entry)
+        self._emit(request_id, "response", response_entry)
+
+    def _emit(self, request_id: str, label: str, payload: dict[str, Any]) -> None:
+        if self._queue is not None:
+            self._queue.put_nowait((request_id, label, payload))
+
+    async def _drain(self, queue: asyncio.Queue[tuple[str, str, dict[str, Any]] | None]) -> None:
+        try:
+            while (item := await queue.get()) is not None:
+                request_id, label, payload = item
+                if self._dump_json:
+                    self._print_json(request_id, label, payload)
+                self._write_dump(request_id, label, payload)
+        except Exception as exc:
+            # Debug output must never change the run result: report once and stop
+            # queueing so later events do not pile up behind a dead worker.
+            self._queue = None
+            print(
+                f"HTTP debug output disabled: {exc.__class__.__name__}: {exc}",
+                file=sys.stderr,
+            )
 
     def _print_json(self, request_id: str, label: str, payload: dict[str, Any]) -> None:
-        dumped = json.dumps(payload, indent=2, sort_keys=True)
+        dumped = _dump_json(payload, pretty=True)
         mode = "sanitized" if self._sanitize_output else "raw"
         print(f"[RAW] {request_id} {label} ({mode}):\n{dumped}", file=sys.stderr)
 
     def _write_dump(self, request_id: str, label: str, payload: dict[str, Any]) -> None:
-        if not self._dump_dir:
+        if not self._dump_file:
             return
-        path = self._dump_dir / f"{self._run_id}.json"
-        entry = self._run_entries.get(request_id)
-        if not entry:
-            entry = {"id": request_id}
-            self._run_entries[request_id] = entry
-        entry[label] = payload
-        entries = [self._run_entries[key] for key in sorted(self._run_entries)]
-        output = {"run_id": self._run_id, "entries": entries}
-        path.write_text(json.dumps(output, indent=2, sort_keys=True), encoding="utf-8")
+        line = _dump_json({"id": request_id, "kind": label, "payload": payload})
+        self._dump_file.write(f"{line}\n")
+
+    async def aclose(self) -> None:
+        try:
+            if self._worker is not None:
+                if self._queue is not None:
+                    # The sentinel lets the worker flush every queued event before exiting.
+                    self._queue.put_nowait(None)
+                await self._worker
+                self._worker = None
+        finally:
+            if self._dump_file:
+                self._dump_file.close()
+                self._dump_file = None
 
 
 class _DebugResponse:
+    # Hot members (status, headers, json, text) are defined here; __getattr__ only
+    # runs on a normal lookup miss, so it stays as a fallback for rare attributes.
+    __slots__ = ("_recorded", "_recorder", "_request_number", "_response")
+
     def __init__(
         self,
         response: aiohttp.ClientResponse,
         recorder: _DebugRecorder | None,
-        request_id: str,
+        request_number: int,
     ) -> None:
         self._response = response
         self._recorder = recorder
-        self._request_id = request_id
-        self._json_cache: Any | None = None
-        self._text_cache: str | None = None
-        self._json_cached = False
-        self._text_cached = False
+        self._request_number = request_number
         self._recorded = False
 
     @property
@@ -382,84 +521,56 @@ class _DebugResponse:
         return getattr(self._response, name)
 
     async def json(self, *args: Any, **kwargs: Any) -> Any:
-        if self._json_cached:
-            return self._json_cache
+        # aiohttp keeps the read body, so repeated json()/text() calls need no cache here.
         try:
             data = await self._response.json(*args, **kwargs)
         except Exception as exc:
-            if self._recorder:
-                self._recorder.record_response(
-                    self._request_id,
-                    status=self._response.status,
-                    headers=self._response.headers,
-                    error=exc,
-                )
-                self._recorded = True
+            self._record(error=exc)
             raise
-        self._json_cached = True
-        self._json_cache = data
-        if self._recorder and not self._recorded:
-            self._recorder.record_response(
-                self._request_id,
-                status=self._response.status,
-                headers=self._response.headers,
-                json_body=data,
-            )
-            self._recorded = True
+        self._record(json_body=data)
         return data
 
     async def text(self, *args: Any, **kwargs: Any) -> str:
-        if self._text_cached:
-            return self._text_cache or ""
         try:
             text = await self._response.text(*args, **kwargs)
         except Exception as exc:
-            if self._recorder:
-                self._recorder.record_response(
-                    self._request_id,
-                    status=self._response.status,
-                    headers=self._response.headers,
-                    error=exc,
-                )
-                self._recorded = True
+            self._record(error=exc)
             raise
-        self._text_cached = True
-        self._text_cache = text
-        if self._recorder and not self._recorded:
-            self._recorder.record_response(
-                self._request_id,
-                status=self._response.status,
-                headers=self._response.headers,
-                text_body=text,
-            )
-            self._recorded = True
+        self._record(text_body=text)
         return text
 
     def record_if_missing(self) -> None:
+        self._record()
+
+    def _record(self, **body: Any) -> None:
         if self._recorded or not self._recorder:
             return
+        # Mark first so a failing recorder cannot make record_if_missing fire again.
+        self._recorded = True
         self._recorder.record_response(
-            self._request_id,
+            self._request_number,
             status=self._response.status,
             headers=self._response.headers,
+            **body,
         )
-        self._recorded = True
 
 
 class _DebugResponseContext:
+    __slots__ = ("_context", "_debug_response", "_recorder", "_request_number")
+
     def __init__(
         self,
         context: Any,
         recorder: _DebugRecorder | None,
-        request_id: str,
+        request_number: int,
     ) -> None:
         self._context = context
         self._recorder = recorder
-        self._request_id = request_id
+        self._request_number = request_number
 
     async def __aenter__(self) -> _DebugResponse:
         response = await self._context.__aenter__()
-        self._debug_response = _DebugResponse(response, self._recorder, self._request_id)
+        self._debug_response = _DebugResponse(response, self._recorder, self._request_number)
         return self._debug_response
 
     async def __aexit__(self, exc_type, exc, tb) -> Literal[False]:
@@ -469,6 +580,8 @@ class _DebugResponseContext:
 
 
 class _DebugSession:
+    __slots__ = ("_recorder", "_session")
+
     def __init__(self, session: aiohttp.ClientSession, recorder: _DebugRecorder | None) -> None:
         self._session = session
         self._recorder = recorder
@@ -478,9 +591,9 @@ class _DebugSession:
         params = kwargs.get("params")
         json_payload = kwargs.get("json")
         data_payload = kwargs.get("data")
-        request_id = "0000"
+        request_number = 0
         if self._recorder:
-            request_id = self._recorder.start_request(
+            request_number = self._recorder.start_request(
                 method=method,
                 url=str(url),
                 headers=headers,
@@ -489,10 +602,11 @@ class _DebugSession:
                 data_payload=data_payload,
             )
         context = self._session.request(method, url, **kwargs)
-        return _DebugResponseContext(context, self._recorder, request_id)
+        return _DebugResponseContext(context, self._recorder, request_number)
 
     async def close(self) -> None:
-        await self._session.close()
+        # The wrapped session is owned and closed by main().
+        return None
 
     @property
     def closed(self) -> bool:
@@ -502,6 +616,20 @@ class _DebugSession:
         return getattr(self._session, name)
 
 
+def _build_session() -> aiohttp.ClientSession:
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=30))
+
+
+def _minutes_delta(value: str) -> timedelta:
+    return timedelta(minutes=int(value))
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run a provider live check.")
     parser.add_argument("--provider", dest="provider_id", help="Provider id (e.g. dvsportal).")
@@ -552,9 +680,10 @@ def _parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--extend-minutes",
-        dest="extend_minutes",
-        type=int,
-        default=15,
+        dest="extend_delta",
+        type=_minutes_delta,
+        default=timedelta(minutes=15),
+        metavar="MINUTES",
         help="Minutes to extend when attempting reservation updates.",
     )
     parser.add_argument(
@@ -564,6 +693,26 @@ def _parse_args() -> argparse.Namespace:
         default=0,
         help="Seconds to wait after creating reservations/favorites before next step.",
     )
+    parser.add_argument(
+        "--verify-after-create",
+        dest="verify_after_create",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=(
+            "List reservations/favorites right after creating them "
+            "(default: on only when --post-create-wait is set)."
+        ),
+    )
+    parser.add_argument(
+        "--parallel-flows",
+        dest="parallel_flows",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help=(
+            "Run the reservation and favorite flows concurrently when both are selected "
+            "(default: on; use --no-parallel-flows for ordered output)."
+        ),
+    )
     parser.add_argument(
         "--timezone",
         dest="timezone",
@@ -648,13 +797,39 @@ def _parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _resolve_settings(args: argparse.Namespace) -> dict[str, str | None]:
+    env = os.environ
+    return {attr: getattr(args, attr, None) or env.get(name) for attr, name in _ENV_FALLBACKS}
+
+
+def _validate_inputs(
+    args: argparse.Namespace,
+    settings: Mapping[str, str | None],
+) -> tuple[str, str, dict[str, Any], str | None]:
+    provider_id = _require_value("provider_id", settings["provider_id"])
+    base_url = _require_value("base_url", settings["base_url"])
+    license_plate = settings["license_plate"]
+    if args.run_all or args.run_reservations or args.run_favorites:
+        _require_value("license_plate", license_plate)
+    extras = _parse_extra(args.extra or [])
+    username = settings["username"]
+    password = settings["password"]
+    if username and password:
+        credentials: dict[str, Any] = {"username": username, "password": password}
+    else:
+        credentials = _load_credentials(settings["credentials_json"], settings["credentials_file"])
+    if extras:
+        credentials.update(extras)
+    return provider_id, base_url, credentials, license_plate
+
+
 def _parse_extra(values: list[str]) -> dict[str, str]:
     extras: dict[str, str] = {}
     for raw in values:
-        if "=" not in raw:
+        key, sep, value = raw.partition("=")
+        if not sep:
             print(f"Invalid extra credential: {raw}", file=sys.stderr)
             raise SystemExit(2)
-        key, value = raw.split("=", 1)
         key = key.strip()
         value = value.strip()
         if not key or not value:
@@ -664,6 +839,17 @@ def _parse_extra(values: list[str]) -> dict[str, str]:
     return extras
 
 
+@lru_cache(maxsize=8)
+def _get_zone(name: str) -> ZoneInfo:
+    # Imported lazily so runs that never build local timestamps skip loading zoneinfo.
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+    try:
+        return ZoneInfo(name)
+    except ZoneInfoNotFoundError as exc:
+        raise ValidationError(f"Timezone '{name}' is unavailable.") from exc
+
+
 def _parse_datetime(value: str, timezone_name: str | None) -> datetime:
     raw = value.strip()
     if not raw:
@@ -677,11 +863,7 @@ def _parse_datetime(value: str, timezone_name: str | None) -> datetime:
     if parsed.tzinfo is None:
         if not timezone_name:
             raise ValidationError("Timestamp must include timezone information.")
-        try:
-            tz = ZoneInfo(timezone_name)
-        except ZoneInfoNotFoundError as exc:
-            raise ValidationError(f"Timezone '{timezone_name}' is unavailable.") from exc
-        parsed = parsed.replace(tzinfo=tz, fold=0)
+        parsed = parsed.replace(tzinfo=_get_zone(timezone_name), fold=0)
     return parsed
 
 
@@ -697,20 +879,20 @@ def _build_reservation_window(
         start_dt = _parse_datetime(start_time, timezone_name)
         end_dt = _parse_datetime(end_time, timezone_name)
         return start_dt, end_dt
-    try:
-        tz = ZoneInfo(timezone_name)
-    except ZoneInfoNotFoundError as exc:
-        raise ValidationError(f"Timezone '{timezone_name}' is unavailable.") from exc
+    tz = _get_zone(timezone_name)
     now_local = datetime.now(tz)
-    start_dt = datetime(
-        now_local.year,
-        now_local.month,
-        now_local.day,
-        2,
-        0,
-        tzinfo=tz,
-    ) + timedelta(days=1)
-    end_dt = start_dt + timedelta(hours=1)
+    start_dt = (
+        datetime(
+            now_local.year,
+            now_local.month,
+            now_local.day,
+            2,
+            0,
+            tzinfo=tz,
+        )
+        + _ONE_DAY
+    )
+    end_dt = start_dt + _ONE_HOUR
     return start_dt, end_dt
 
 
@@ -721,14 +903,11 @@ async def _run_reservation_flow(
     reservation_name: str | None,
     start_time: str | None,
     end_time: str | None,
-    extend_minutes: int,
+    extend_delta: timedelta,
     timezone_name: str,
-    post_create_wait: int,
-    traceback_enabled: bool,
-    debug_enabled: bool,
-    sanitize_output: bool,
+    config: _RunConfig,
 ) -> None:
-    flow_started_at = _log_step_start("Reservation flow")
+    flow_started_at = _log_step_start("Reservation flow", config=config)
     try:
         start_dt, end_dt = _build_reservation_window(
             start_time,
@@ -736,23 +915,22 @@ async def _run_reservation_flow(
             timezone_name=timezone_name,
         )
     except ValidationError as exc:
-        print(f"Reservation time error: {exc}", file=sys.stderr)
-        _log_step_abort("Reservation flow", "invalid time window")
+        _print_line(f"Reservation time error: {exc}", sys.stderr)
+        _log_step_abort("Reservation flow", "invalid time window", config=config)
         return
 
-    if debug_enabled:
+    if config.debug:
         start_utc = start_dt.astimezone(UTC)
         end_utc = end_dt.astimezone(UTC)
-        plate_value = _mask_license_plate(license_plate) if sanitize_output else license_plate
-        print(
-            f"Reservation window (local): {start_dt.isoformat()} -> {end_dt.isoformat()}",
-            file=sys.stderr,
+        plate_value = _masked_plate(license_plate) if config.sanitize else license_plate
+        _write_lines(
+            [
+                f"Reservation window (local): {start_dt.isoformat()} -> {end_dt.isoformat()}",
+                f"Reservation window (UTC): {start_utc.isoformat()} -> {end_utc.isoformat()}",
+                f"Reservation plate: {plate_value}",
+            ],
+            sys.stderr,
         )
-        print(
-            f"Reservation window (UTC): {start_utc.isoformat()} -> {end_utc.isoformat()}",
-            file=sys.stderr,
-        )
-        print(f"Reservation plate: {plate_value}", file=sys.stderr)
 
     try:
         created = await _run_step(
@@ -763,68 +941,81 @@ async def _run_reservation_flow(
                 end_dt,
                 name=reservation_name,
             ),
-            trace=traceback_enabled,
+            config=config,
         )
-        print(
+        _print_line(
             _format_action(
                 "Reservation created",
-                _format_reservation(created, sanitize=sanitize_output),
+                _format_reservation(created, sanitize=config.sanitize),
                 color="green",
+                config=config,
             )
         )
     except Exception:
-        _log_step_abort("Reservation flow", "create failed")
+        _log_step_abort("Reservation flow", "create failed", config=config)
         return
-    if post_create_wait > 0:
-        await asyncio.sleep(post_create_wait)
-    try:
-        active = await _run_step(
-            "Reservation list (post-create)",
-            provider.list_reservations(),
-            trace=traceback_enabled,
-        )
-        print(_format_action("Reservations after create", str(len(active)), color="cyan"))
-        for reservation in active:
-            print(f"- {_format_reservation(reservation, sanitize=sanitize_output)}")
-    except Exception:
-        pass
+    if config.post_create_wait > 0:
+        await asyncio.sleep(config.post_create_wait)
+    if config.verify_after_create:
+        try:
+            active = await _run_step(
+                "Reservation list (post-create)",
+                provider.list_reservations(),
+                config=config,
+            )
+            lines = [
+                _format_action(
+                    "Reservations after create", str(len(active)), color="cyan", config=config
+                )
+            ]
+            lines.extend(
+                f"- {_format_reservation(reservation, sanitize=config.sanitize)}"
+                for reservation in active
+            )
+            _write_lines(lines)
+        except Exception:
+            pass
 
-    updated_end = end_dt + timedelta(minutes=extend_minutes)
+    updated_end = end_dt + extend_delta
     try:
         updated = await _run_step(
             "Reservation update",
             provider.update_reservation(created.id, end_time=updated_end),
-            trace=traceback_enabled,
+            config=config,
         )
-        print(
+        _print_line(
             _format_action(
                 "Reservation updated",
-                _format_reservation(updated, sanitize=sanitize_output),
+                _format_reservation(updated, sanitize=config.sanitize),
                 color="green",
+                config=config,
             )
         )
         created = updated
         end_dt = updated_end
     except ProviderError as exc:
-        print(_format_action("Reservation update skipped", str(exc), color="yellow"))
+        _print_line(
+            _format_action("Reservation update skipped", str(exc), color="yellow", config=config)
+        )
     except Exception:
         pass
     try:
         ended = await _run_step(
             "Reservation end",
             provider.end_reservation(created.id, end_dt),
-            trace=traceback_enabled,
+            config=config,
         )
-        print(
+        _print_line(
             _format_action(
                 "Reservation ended",
-                _format_reservation(ended, sanitize=sanitize_output),
+                _format_reservation(ended, sanitize=config.sanitize),
                 color="green",
+                config=config,
             )
         )
     except Exception:
         pass
-    _log_step_done("Reservation flow", flow_started_at)
+    _log_step_done("Reservation flow", flow_started_at, config=config)
 
 
 async def _run_favorite_flow(
@@ -832,49 +1023,56 @@ async def _run_favorite_flow(
     *,
     license_plate: str,
     favorite_name: str | None,
-    post_create_wait: int,
-    traceback_enabled: bool,
-    debug_enabled: bool,
-    sanitize_output: bool,
+    config: _RunConfig,
 ) -> None:
-    flow_started_at = _log_step_start("Favorite flow")
+    flow_started_at = _log_step_start("Favorite flow", config=config)
 
-    async def _print_favorites(label: str) -> None:
+    async def _list_favorites(label: str) -> list[Favorite] | None:
         try:
-            favorites = await _run_step(
+            return await _run_step(
                 f"Favorite list ({label})",
                 provider.list_favorites(),
-                trace=traceback_enabled,
+                config=config,
             )
         except Exception:
+            return None
+
+    def _print_favorites(label: str, favorites: list[Favorite] | None) -> None:
+        if favorites is None:
             return
-        print(_format_action(f"Favorites {label}", str(len(favorites)), color="cyan"))
-        for favorite in favorites:
-            print(f"- {_format_favorite(favorite, sanitize=sanitize_output)}")
+        lines = [
+            _format_action(f"Favorites {label}", str(len(favorites)), color="cyan", config=config)
+        ]
+        lines.extend(
+            f"- {_format_favorite(favorite, sanitize=config.sanitize)}" for favorite in favorites
+        )
+        _write_lines(lines)
 
     name_for_create = _build_favorite_name(license_plate, favorite_name)
-    if debug_enabled:
-        plate_value = _mask_license_plate(license_plate) if sanitize_output else license_plate
-        print(f"Favorite plate: {plate_value}", file=sys.stderr)
+    if config.debug:
+        plate_value = _masked_plate(license_plate) if config.sanitize else license_plate
+        _print_line(f"Favorite plate: {plate_value}", sys.stderr)
     try:
         created = await _run_step(
             "Favorite create",
             provider.add_favorite(license_plate, name=name_for_create),
-            trace=traceback_enabled,
+            config=config,
         )
-        print(
+        _print_line(
             _format_action(
                 "Favorite created",
-                _format_favorite(created, sanitize=sanitize_output),
+                _format_favorite(created, sanitize=config.sanitize),
                 color="green",
+                config=config,
             )
         )
     except Exception:
-        _log_step_abort("Favorite flow", "create failed")
+        _log_step_abort("Favorite flow", "create failed", config=config)
         return
-    if post_create_wait > 0:
-        await asyncio.sleep(post_create_wait)
-    await _print_favorites("after create")
+    if config.post_create_wait > 0:
+        await asyncio.sleep(config.post_create_wait)
+    if config.verify_after_create:
+        _print_favorites("after create", await _list_favorites("after create"))
 
     updated_name = f"{created.name or favorite_name or 'Favorite'} (updated)"
     if getattr(provider, "favorite_update_possible", False):
@@ -886,35 +1084,53 @@ async def _run_favorite_flow(
                     license_plate=created.license_plate,
                     name=updated_name,
                 ),
-                trace=traceback_enabled,
+                config=config,
             )
-            print(
+            _print_line(
                 _format_action(
                     "Favorite updated",
-                    _format_favorite(updated, sanitize=sanitize_output),
+                    _format_favorite(updated, sanitize=config.sanitize),
                     color="green",
+                    config=config,
                 )
             )
             created = updated
         except Exception:
             pass
     else:
-        print(
-            _format_action("Favorite update skipped", "updates are not supported", color="yellow")
+        _print_line(
+            _format_action(
+                "Favorite update skipped",
+                "updates are not supported",
+                color="yellow",
+                config=config,
+            )
         )
-    await _print_favorites("after update")
+    _print_favorites("after update", await _list_favorites("after update"))
 
     try:
         await _run_step(
             "Favorite remove",
             provider.remove_favorite(created.id),
-            trace=traceback_enabled,
+            config=config,
         )
-        print(_format_action("Favorite removed", created.id, color="green"))
+        _print_line(_format_action("Favorite removed", created.id, color="green", config=config))
     except Exception:
         pass
-    await _print_favorites("after remove")
-    _log_step_done("Favorite flow", flow_started_at)
+    _print_favorites("after remove", await _list_favorites("after remove"))
+    _log_step_done("Favorite flow", flow_started_at, config=config)
+
+
+async def _run_flow(name: str, flow: Awaitable[None]) -> Exception | None:
+    # Tag every line the flow prints; the prefix is scoped to the current context.
+    token = _LINE_PREFIX.set(f"[{name}] ")
+    try:
+        await flow
+    except Exception as exc:
+        return exc
+    finally:
+        _LINE_PREFIX.reset(token)
+    return None
 
 
 async def main() -> int:
@@ -923,153 +1139,182 @@ async def main() -> int:
     if args.debug and log_level == "INFO":
         log_level = "DEBUG"
     logging.basicConfig(level=log_level)
-    global _COLOR_ENABLED
     if args.color == "always":
-        _COLOR_ENABLED = True
+        color = True
     elif args.color == "never":
-        _COLOR_ENABLED = False
+        color = False
     else:
-        _COLOR_ENABLED = sys.stdout.isatty() or sys.stderr.isatty()
-    provider_id = args.provider_id or os.getenv("PROVIDER_ID")
-    base_url = args.base_url or os.getenv("BASE_URL")
-    api_uri = args.api_uri or os.getenv("API_URI")
-    credentials_json = args.credentials_json or os.getenv("CREDENTIALS_JSON")
-    credentials_file = args.credentials_file or os.getenv("CREDENTIALS_FILE")
-    username = args.username or os.getenv("USERNAME")
-    password = args.password or os.getenv("PASSWORD")
-    extras = _parse_extra(args.extra or [])
+        color = sys.stdout.isatty() or sys.stderr.isatty()
+    settings = _resolve_settings(args)
+    # Run every argument check before any session or network setup.
+    provider_id, base_url, credentials, license_plate = _validate_inputs(args, settings)
+    api_uri = settings["api_uri"]
     run_reservations = args.run_all or args.run_reservations
     run_favorites = args.run_all or args.run_favorites
-    license_plate = args.license_plate or os.getenv("LICENSE_PLATE")
-
-    provider_id = _require_value("provider_id", provider_id)
-    base_url = _require_value("base_url", base_url)
+    verify_after_create = args.verify_after_create
+    if verify_after_create is None:
+        verify_after_create = args.post_create_wait > 0
+    config = _RunConfig(
+        color=color,
+        traceback=args.traceback,
+        debug=args.debug,
+        sanitize=args.sanitize_output,
+        post_create_wait=args.post_create_wait,
+        verify_after_create=verify_after_create,
+    )
     print(
         _style(
             f"[RUN] provider={provider_id} base_url={base_url} api_uri={api_uri or '-'}",
             "magenta",
+            enabled=config.color,
             bold=True,
         ),
         file=sys.stderr,
     )
-    if username and password:
-        credentials = {"username": username, "password": password}
-    else:
-        credentials = _load_credentials(credentials_json, credentials_file)
-    if extras:
-        credentials.update(extras)
-    if (run_reservations or run_favorites) and not license_plate:
-        print("Missing required value: license_plate", file=sys.stderr)
-        return 2
 
     if args.debug:
-        plate_value = (
-            _mask_license_plate(license_plate or "") if args.sanitize_output else license_plate
-        )
+        plate_value = _masked_plate(license_plate or "") if config.sanitize else license_plate
         if not plate_value:
             plate_value = "-"
-        print(
-            "Debug config: "
-            f"provider_id={provider_id} base_url={base_url} api_uri={api_uri} "
-            f"run_reservations={run_reservations} run_favorites={run_favorites} "
-            f"license_plate={plate_value}",
-            file=sys.stderr,
-        )
         key_list = ", ".join(sorted(credentials.keys())) if credentials else "-"
-        print(f"Credential keys: {key_list}", file=sys.stderr)
+        _write_lines(
+            [
+                "Debug config: "
+                f"provider_id={provider_id} base_url={base_url} api_uri={api_uri} "
+                f"run_reservations={run_reservations} run_favorites={run_favorites} "
+                f"license_plate={plate_value}",
+                f"Credential keys: {key_list}",
+            ],
+            sys.stderr,
+        )
 
     recorder = _DebugRecorder(
         enabled=args.debug_http or args.dump_json or bool(args.dump_dir),
         dump_json=args.dump_json,
         dump_dir=Path(args.dump_dir) if args.dump_dir else None,
         max_text=args.dump_limit,
-        sanitize_output=args.sanitize_output,
+        config=config,
     )
-    debug_session: _DebugSession | None = None
     if recorder._enabled:
-        session = aiohttp.ClientSession()
-        debug_session = _DebugSession(session, recorder)
-        mode = "sanitized" if args.sanitize_output else "raw"
+        mode = "sanitized" if config.sanitize else "raw"
         _LOGGER.info("HTTP debug enabled (%s output).", mode)
 
     try:
-        async with Client(
-            session=debug_session,
-            base_url=base_url,
-            api_uri=api_uri,
-        ) as client:
+        # One pooled session for the whole run so every call reuses DNS, TCP and TLS setup.
+        async with (
+            _build_session() as session,
+            Client(
+                session=_DebugSession(session, recorder) if recorder._enabled else session,
+                base_url=base_url,
+                api_uri=api_uri,
+            ) as client,
+        ):
             provider = await _run_step(
                 "Provider load",
                 client.get_provider(provider_id),
-                trace=args.traceback,
+                config=config,
             )
             await _run_step(
                 "Login",
                 provider.login(credentials=credentials),
-                trace=args.traceback,
-            )
-            permit = await _run_step("Permit fetch", provider.get_permit(), trace=args.traceback)
-            reservations = await _run_step(
-                "Reservation list",
-                provider.list_reservations(),
-                trace=args.traceback,
+                config=config,
             )
-            favorites = await _run_step(
-                "Favorite list",
-                provider.list_favorites(),
-                trace=args.traceback,
+            # The read-only calls are independent, so overlap them on the shared session.
+            permit, reservations, favorites = await asyncio.gather(
+                _run_step("Permit fetch", provider.get_permit(), config=config),
+                _run_step(
+                    "Reservation list",
+                    provider.list_reservations(),
+                    config=config,
+                ),
+                _run_step(
+                    "Favorite list",
+                    provider.list_favorites(),
+                    config=config,
+                ),
             )
+            flows: list[tuple[str, Awaitable[None]]] = []
             if run_reservations:
-                await _run_reservation_flow(
-                    provider,
-                    license_plate=license_plate,
-                    reservation_name=args.reservation_name,
-                    start_time=args.start_time,
-                    end_time=args.end_time,
-                    extend_minutes=args.extend_minutes,
-                    timezone_name=args.timezone,
-                    post_create_wait=args.post_create_wait,
-                    traceback_enabled=args.traceback,
-                    debug_enabled=args.debug,
-                    sanitize_output=args.sanitize_output,
+                flows.append(
+                    (
+                        "reservations",
+                        _run_reservation_flow(
+                            provider,
+                            license_plate=license_plate,
+                            reservation_name=args.reservation_name,
+                            start_time=args.start_time,
+                            end_time=args.end_time,
+                            extend_delta=args.extend_delta,
+                            timezone_name=args.timezone,
+                            config=config,
+                        ),
+                    )
                 )
             if run_favorites:
-                await _run_favorite_flow(
-                    provider,
-                    license_plate=license_plate,
-                    favorite_name=args.favorite_name,
-                    post_create_wait=args.post_create_wait,
-                    traceback_enabled=args.traceback,
-                    debug_enabled=args.debug,
-                    sanitize_output=args.sanitize_output,
+                flows.append(
+                    (
+                        "favorites",
+                        _run_favorite_flow(
+                            provider,
+                            license_plate=license_plate,
+                            favorite_name=args.favorite_name,
+                            config=config,
+                        ),
+                    )
                 )
+            if args.parallel_flows:
+                # Reservations and favorites are independent resources, so overlap the
+                # two flows; each keeps its own create -> update -> end ordering.
+                results = await asyncio.gather(*(_run_flow(name, flow) for name, flow in flows))
+            else:
+                results = [await _run_flow(name, flow) for name, flow in flows]
+            failures = [result for result in results if result is not None]
+            for failure in failures:
+                _print_exception("Flow failed", failure, config=config)
+            if failures:
+                return 1
     except Exception as exc:
         if not _ERROR_REPORTED:
-            _print_exception("Error", exc, trace=args.traceback)
+            _print_exception("Error", exc, config=config)
         return 1
     finally:
-        if debug_session:
-            await debug_session.close()
+        await recorder.aclose()
 
     provider_info = provider.info
-    print(
+    lines = [
         _format_action(
             "Provider",
             f"{provider.provider_name} ({provider.provider_id}) | "
             f"favorite_update_fields={provider_info.favorite_update_fields} | "
             f"reservation_update_fields={provider_info.reservation_update_fields}",
             color="cyan",
-        )
+            config=config,
+        ),
+        _format_action("Permit", str(permit), color="cyan", config=config),
+        _format_action("Reservations", str(len(reservations)), color="cyan", config=config),
+    ]
+    lines.extend(
+        f"- {_format_reservation(reservation, sanitize=config.sanitize)}"
+        for reservation in reservations
+    )
+    lines.append(_format_action("Favorites", str(len(favorites)), color="cyan", config=config))
+    lines.extend(
+        f"- {_format_favorite(favorite, sanitize=config.sanitize)}" for favorite in favorites
     )
-    print(_format_action("Permit", str(permit), color="cyan"))
-    print(_format_action("Reservations", str(len(reservations)), color="cyan"))
-    for reservation in reservations:
-        print(f"- {_format_reservation(reservation, sanitize=args.sanitize_output)}")
-    print(_format_action("Favorites", str(len(favorites)), color="cyan"))
-    for favorite in favorites:
-        print(f"- {_format_favorite(favorite, sanitize=args.sanitize_output)}")
+    _write_lines(lines)
     return 0
 
 
+def _event_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    # uvloop/winloop are optional speedups for the many short HTTP calls;
+    # fall back to the default asyncio loop when they are not installed.
+    module_name = "winloop" if sys.platform == "win32" else "uvloop"
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        return None
+    return module.new_event_loop
+
+
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    raise SystemExit(asyncio.run(main(), loop_factory=_event_loop_factory()))
@@ -4,11 +4,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
+import re
+import string
 import sys
 from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import repeat
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
+
+# orjson is an optional, faster parser; its JSONDecodeError subclasses the stdlib one.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 _SENSITIVE_KEYS = {
     "password",
@@ -54,13 +67,15 @@ _PLATE_KEYS = {
     "vehicle_plate",
     "plate",
 }
-_PLATE_VALUE_KEYS = {
-    "displayvalue",
-    "display_value",
-    "normalizedvalue",
-    "normalized_value",
-    "value",
-}
+_PLATE_VALUE_KEYS = frozenset(
+    {
+        "displayvalue",
+        "display_value",
+        "normalizedvalue",
+        "normalized_value",
+        "value",
+    }
+)
 _PERMIT_MEDIA_CONTAINER_KEYS = {
     "permitmedias",
     "permit_medias",
@@ -71,6 +86,31 @@ _NON_SENSITIVE_KEYS = {
 }
 
 
+def _fragment_pattern(fragments: set[str]) -> re.Pattern[str]:
+    # One compiled alternation per category replaces a Python-level `in` per fragment.
+    return re.compile("|".join(re.escape(fragment) for fragment in sorted(fragments)))
+
+
+_NON_SENSITIVE_RE = _fragment_pattern(_NON_SENSITIVE_KEYS)
+_SENSITIVE_RE = _fragment_pattern(_SENSITIVE_KEYS)
+_PII_RE = _fragment_pattern(_PII_KEYS)
+_PLATE_RE = _fragment_pattern(_PLATE_KEYS)
+
+# Plates are masked per alphanumeric character; separators stay visible. ASCII plates
+# take a bytes.translate fast path, anything else uses the equivalent Unicode regex.
+_ALNUM_ASCII = (string.ascii_letters + string.digits).encode("ascii")
+_ASCII_PLATE_MASK = bytes.maketrans(_ALNUM_ASCII, b"*" * len(_ALNUM_ASCII))
+_PLATE_CHAR_RE = re.compile(r"[^\W_]")
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+_KEY_PLAIN = 0
+_KEY_NON_SENSITIVE = 1
+_KEY_MASKED = 2
+_KEY_PLATE = 3
+_KEY_PERMIT_MEDIA = 4
+
+
 def mask_value(value: Any) -> Any:
     """Return a length-preserving mask for a value."""
     if value is None:
@@ -88,22 +128,15 @@ def mask_license_plate(plate: str) -> str:
     """Return a masked representation of a license plate."""
     if not isinstance(plate, str):
         return mask_value(plate)
-    masked_chars: list[str] = []
-    has_maskable = False
-    for ch in plate:
-        if ch.isalnum():
-            masked_chars.append("*")
-            has_maskable = True
-        else:
-            masked_chars.append(ch)
-    if not has_maskable:
-        return plate
-    return "".join(masked_chars)
+    if plate.isascii():
+        return plate.encode("ascii").translate(_ASCII_PLATE_MASK).decode("ascii")
+    return _PLATE_CHAR_RE.sub("*", plate)
 
 
 def _mask_container(value: Any) -> Any:
     if isinstance(value, dict):
-        return {str(k): _mask_container(v) for k, v in value.items()}
+        items = sorted(((str(k), v) for k, v in value.items()), key=itemgetter(0))
+        return {key: _mask_container(item) for key, item in items}
     if isinstance(value, list):
         return [_mask_container(item) for item in value]
     return mask_value(value)
@@ -116,9 +149,11 @@ def _mask_plate_value(value: Any) -> Any:
         return [_mask_plate_value(item) for item in value]
     if isinstance(value, dict):
         sanitized: dict[str, Any] = {}
-        for item_key, item_value in value.items():
-            key_text = str(item_key)
-            if key_text.lower() in _PLATE_VALUE_KEYS:
+        # Insert in sorted key order like _sanitize_dict; writers do not sort again.
+        items = sorted(((str(k), v) for k, v in value.items()), key=itemgetter(0))
+        for key_text, item_value in items:
+            # Provider keys are usually already lowercase; skip lower() for those.
+            if key_text in _PLATE_VALUE_KEYS or key_text.lower() in _PLATE_VALUE_KEYS:
                 if isinstance(item_value, str):
                     sanitized[key_text] = mask_license_plate(item_value)
                 else:
@@ -129,15 +164,27 @@ def _mask_plate_value(value: Any) -> Any:
     return mask_value(value)
 
 
-def _mask_value_for_key(key: str, value: Any) -> Any:
+@lru_cache(maxsize=2048)
+def _classify_key(key: str) -> int:
+    # Payload keys repeat across list items, so each distinct key is classified once.
     key_lower = key.lower()
-    if any(fragment in key_lower for fragment in _NON_SENSITIVE_KEYS):
-        return value
-    if any(fragment in key_lower for fragment in _SENSITIVE_KEYS):
-        return _mask_container(value)
-    if any(fragment in key_lower for fragment in _PII_KEYS):
+    # Categories are checked separately to keep their precedence order.
+    if _NON_SENSITIVE_RE.search(key_lower):
+        return _KEY_NON_SENSITIVE
+    if _SENSITIVE_RE.search(key_lower) or _PII_RE.search(key_lower):
+        return _KEY_MASKED
+    if _PLATE_RE.search(key_lower):
+        return _KEY_PLATE
+    if key_lower in _PERMIT_MEDIA_CONTAINER_KEYS:
+        return _KEY_PERMIT_MEDIA
+    return _KEY_PLAIN
+
+
+def _mask_value_for_key(key: str, value: Any) -> Any:
+    category = _classify_key(key)
+    if category == _KEY_MASKED:
         return _mask_container(value)
-    if any(fragment in key_lower for fragment in _PLATE_KEYS):
+    if category == _KEY_PLATE:
         return _mask_plate_value(value)
     return value
 
@@ -148,10 +195,13 @@ def sanitize_data(value: Any, *, key: str | None = None) -> Any:
         masked = _mask_value_for_key(key, value)
         if masked is not value:
             return masked
+    # Exact-type check for JSON leaves, which are most nodes; subclasses fall through.
+    if type(value) in _SCALAR_TYPES:
+        return value
     if isinstance(value, dict):
-        return {str(k): sanitize_data(v, key=str(k)) for k, v in value.items()}
+        return _sanitize_dict(value)
     if isinstance(value, list):
-        if key is not None and key.lower() in _PERMIT_MEDIA_CONTAINER_KEYS:
+        if key is not None and _classify_key(key) == _KEY_PERMIT_MEDIA:
             return [_sanitize_permit_media(item) for item in value]
         return [sanitize_data(item, key=key) for item in value]
     if isinstance(value, datetime):
@@ -165,10 +215,20 @@ def sanitize_data(value: Any, *, key: str | None = None) -> Any:
     return str(value)
 
 
+def _sanitize_dict(value: dict[Any, Any]) -> dict[str, Any]:
+    # Convert each key once (JSON keys are already str) and insert in sorted order,
+    # so writers can emit the tree without a second sort_keys pass.
+    items = sorted(
+        ((key if type(key) is str else str(key), item) for key, item in value.items()),
+        key=itemgetter(0),
+    )
+    return {key_text: sanitize_data(item, key=key_text) for key_text, item in items}
+
+
 def _sanitize_permit_media(value: Any) -> Any:
     if not isinstance(value, dict):
         return sanitize_data(value)
-    sanitized = {str(k): sanitize_data(v, key=str(k)) for k, v in value.items()}
+    sanitized = _sanitize_dict(value)
     for item_key in list(sanitized.keys()):
         if item_key.lower() == "code":
             sanitized[item_key] = mask_value(sanitized[item_key])
@@ -178,7 +238,8 @@ def _sanitize_permit_media(value: Any) -> Any:
 def sanitize_headers(headers: Mapping[str, Any]) -> dict[str, Any]:
     """Return sanitized headers."""
     sanitized: dict[str, Any] = {}
-    for key, value in headers.items():
+    # Insert in sorted key order like _sanitize_dict; writers do not sort again.
+    for key, value in sorted(headers.items(), key=itemgetter(0)):
         if key.lower() == "authorization":
             sanitized[key] = mask_value(value)
         else:
@@ -187,17 +248,53 @@ def sanitize_headers(headers: Mapping[str, Any]) -> dict[str, Any]:
 
 
 def sanitize_file(path: Path) -> Any:
-    """Load and sanitize a JSON file."""
+    """Load and sanitize a JSON or NDJSON file."""
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Parse straight from bytes so the file is never held as a decoded str too.
+        with path.open("rb") as handle:
+            if path.suffix == ".ndjson":
+                # Live check run files hold one JSON event per line.
+                data = [_json_loads(line) for line in handle if line.strip()]
+            else:
+                data = _json_loads(handle.read())
     except json.JSONDecodeError as exc:
         raise ValueError(f"Invalid JSON: {exc}") from exc
     return sanitize_data(data)
 
 
+def _write_json(data: Any, handle: TextIO, *, ndjson: bool, indent: int) -> None:
+    # sanitize_data already inserts dict keys in sorted order.
+    if ndjson:
+        # Keep NDJSON input line-delimited so the output stays a valid run file.
+        for item in data:
+            json.dump(item, handle, ensure_ascii=True)
+            handle.write("\n")
+        return
+    json.dump(data, handle, indent=indent, ensure_ascii=True)
+
+
+def _write_file(data: Any, target: Path, *, ndjson: bool, indent: int) -> None:
+    with target.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        _write_json(data, handle, ndjson=ndjson, indent=indent)
+
+
+def _sanitize_in_place(path: Path, indent: int) -> str | None:
+    # Runs in a worker process for batch mode; returns an error message instead of raising.
+    try:
+        data = sanitize_file(path)
+        _write_file(data, path, ndjson=path.suffix == ".ndjson", indent=indent)
+    except (OSError, ValueError) as exc:
+        return f"{path}: {exc}"
+    return None
+
+
 def _parse_args() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Sanitize a JSON file for sharing.")
-    parser.add_argument("input", help="Path to the JSON file.")
+    parser = argparse.ArgumentParser(description="Sanitize JSON files for sharing.")
+    parser.add_argument(
+        "input",
+        nargs="+",
+        help="Path to the JSON file (several paths require --in-place).",
+    )
     parser.add_argument(
         "--output",
         dest="output",
@@ -207,7 +304,7 @@ def _parse_args() -> argparse.Namespace:
         "--in-place",
         dest="in_place",
         action="store_true",
-        help="Overwrite the input file with sanitized JSON.",
+        help="Overwrite the input file(s) with sanitized JSON.",
     )
     parser.add_argument(
         "--indent",
@@ -222,31 +319,40 @@ def _parse_args() -> argparse.Namespace:
 def main() -> int:
     """CLI entrypoint for sanitizing JSON files."""
     args = _parse_args()
-    input_path = Path(args.input)
-    if not input_path.exists():
-        print(f"File not found: {input_path}", file=sys.stderr)
-        return 2
+    input_paths = [Path(value) for value in args.input]
+    for input_path in input_paths:
+        if not input_path.exists():
+            print(f"File not found: {input_path}", file=sys.stderr)
+            return 2
     if args.in_place and args.output:
         print("Use --in-place or --output, not both.", file=sys.stderr)
         return 2
+    if len(input_paths) > 1:
+        if not args.in_place:
+            print("Multiple input files require --in-place.", file=sys.stderr)
+            return 2
+        # Sanitizing is CPU-bound pure Python, so fan files out across processes.
+        workers = min(len(input_paths), os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(_sanitize_in_place, input_paths, repeat(args.indent))
+            errors = [error for error in results if error]
+        for error in errors:
+            print(error, file=sys.stderr)
+        return 2 if errors else 0
+    input_path = input_paths[0]
     try:
         output_data = sanitize_file(input_path)
     except ValueError as exc:
         print(str(exc), file=sys.stderr)
         return 2
-    output_text = json.dumps(
-        output_data,
-        indent=args.indent,
-        sort_keys=True,
-        ensure_ascii=True,
-    )
-    if args.in_place:
-        input_path.write_text(output_text, encoding="utf-8")
-        return 0
-    if args.output:
-        Path(args.output).write_text(output_text, encoding="utf-8")
+    ndjson = input_path.suffix == ".ndjson"
+    target = input_path if args.in_place else Path(args.output) if args.output else None
+    if target is None:
+        _write_json(output_data, sys.stdout, ndjson=ndjson, indent=args.indent)
+        if not ndjson:
+            sys.stdout.write("\n")
         return 0
-    print(output_text)
+    _write_file(output_data, target, ndjson=ndjson, indent=args.indent)
     return 0
 
 
@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from .client import Client
 from .exceptions import (
     AuthError,
     ConfigError,
@@ -18,6 +18,9 @@ from .exceptions import (
 )
 from .models import Favorite, Permit, ProviderInfo, Reservation, ZoneValidityBlock
 
+if TYPE_CHECKING:
+    from .client import Client
+
 try:
     __version__ = version("pycityvisitorparking")
 except PackageNotFoundError:  # pragma: no cover - not installed
@@ -41,3 +44,12 @@ __all__ = [
     "ZoneValidityBlock",
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Import Client (and aiohttp) on first access so models/exceptions stay cheap to import.
+    if name == "Client":
+        from .client import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import importlib
 import logging
+from functools import cache
 
 import aiohttp
 
@@ -14,13 +15,21 @@ from .provider.base import BaseProvider
 from .provider.loader import ProviderManifest, get_manifest, list_providers
 
 _DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30)
+_KEEPALIVE_TIMEOUT = 30.0
+_DNS_CACHE_TTL = 300
 _LOGGER = logging.getLogger(__name__)
 
 
 def _load_provider_data(provider_id: str) -> tuple[ProviderManifest, type[BaseProvider]]:
     if not provider_id:
         raise ProviderError("Provider id is required.")
+    # Manifests keep their own TTL cache; only the provider class is memoized here.
     manifest = get_manifest(provider_id)
+    return manifest, _load_provider_class(provider_id)
+
+
+@cache
+def _load_provider_class(provider_id: str) -> type[BaseProvider]:
     module_name = f"pycityvisitorparking.provider.{provider_id}"
     try:
         module = importlib.import_module(module_name)
@@ -31,7 +40,7 @@ def _load_provider_data(provider_id: str) -> tuple[ProviderManifest, type[BasePr
         raise ProviderError("Provider module does not export Provider.")
     if not isinstance(provider_cls, type) or not issubclass(provider_cls, BaseProvider):
         raise ProviderError("Provider must inherit from BaseProvider.")
-    return manifest, provider_cls
+    return provider_cls
 
 
 class Client:
@@ -54,6 +63,8 @@ class Client:
         self._retry_count = max(0, retry_count)
 
     async def __aenter__(self) -> Client:
+        # Open the internal session up front so all provider calls share one keep-alive pool.
+        self._ensure_session()
         return self
 
     async def __aexit__(self, exc_type, exc, tb) -> None:
@@ -96,5 +107,9 @@ class Client:
     def _ensure_session(self) -> aiohttp.ClientSession:
         if self._session is None:
             _LOGGER.debug("Creating internal aiohttp session")
-            self._session = aiohttp.ClientSession(timeout=self._timeout)
+            connector = aiohttp.TCPConnector(
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(timeout=self._timeout, connector=connector)
         return self._session
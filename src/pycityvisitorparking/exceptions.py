@@ -16,7 +16,7 @@ class PyCityVisitorParkingError(Exception):
         user_message: str | None = None,
     ) -> None:
         """Initialize exception metadata with safe, optional user messaging."""
-        if message is None and detail is not None:
+        if message is None:
             message = detail
         if message is None:
             super().__init__()
@@ -14,7 +14,6 @@ from ..exceptions import AuthError, NetworkError, ProviderError, ValidationError
 from ..models import Favorite, Permit, ProviderInfo, Reservation, ZoneValidityBlock
 from ..util import (
     ensure_utc_timestamp,
-    filter_chargeable_zone_validity,
     format_utc_timestamp,
     normalize_datetime,
     normalize_license_plate,
@@ -139,17 +138,21 @@ class BaseProvider(ABC):
 
     def _filter_chargeable_zone_validity(
         self,
-        entries: list[tuple[ZoneValidityBlock, bool]],
+        entries: Iterable[tuple[ZoneValidityBlock, bool]],
     ) -> list[ZoneValidityBlock]:
-        filtered = filter_chargeable_zone_validity(entries)
+        # Filter and normalize in one pass; blocks that are already normalized are reused.
         normalized: list[ZoneValidityBlock] = []
-        for block in filtered:
+        for block, is_chargeable in entries:
+            if not is_chargeable:
+                continue
             try:
                 start = self._ensure_utc_timestamp(block.start_time)
                 end = self._ensure_utc_timestamp(block.end_time)
             except ValidationError as exc:
                 raise ProviderError("Provider returned invalid zone validity data.") from exc
-            normalized.append(ZoneValidityBlock(start_time=start, end_time=end))
+            if start != block.start_time or end != block.end_time:
+                block = ZoneValidityBlock(start_time=start, end_time=end)
+            normalized.append(block)
         return normalized
 
     def _parse_int(self, value: Any) -> int:
@@ -226,6 +229,11 @@ class BaseProvider(ABC):
         retries = self._retry_count if method.upper() == "GET" else 0
         attempts = retries + 1
         last_error: Exception | None = None
+        # The request arguments are the same for every attempt; merge them once.
+        merged_kwargs = dict(request_kwargs)
+        merged_kwargs.setdefault("ssl", True)
+        timeout = merged_kwargs.get("timeout")
+        merged_kwargs["timeout"] = self._timeout if timeout is None else timeout
         for attempt in range(attempts):
             _LOGGER.debug(
                 "Provider %s request %s (attempt %s/%s)",
@@ -235,12 +243,6 @@ class BaseProvider(ABC):
                 attempts,
             )
             try:
-                timeout = request_kwargs.get("timeout", self._timeout)
-                if timeout is None:
-                    timeout = self._timeout
-                merged_kwargs = dict(request_kwargs)
-                merged_kwargs.setdefault("ssl", True)
-                merged_kwargs["timeout"] = timeout
                 async with self._session.request(method, url, **merged_kwargs) as response:
                     return await response_handler(response, attempt, attempts)
             except self._RetryRequest:
@@ -36,6 +36,7 @@ from .const import (
 )
 
 _LOGGER = logging.getLogger(__name__)
+_TIMESTAMP_CACHE_SIZE = 512
 
 
 class Provider(BaseProvider):
@@ -64,10 +65,12 @@ class Provider(BaseProvider):
         )
         self._token: str | None = None
         self._auth_header_value: str | None = None
+        self._auth_headers_cache: tuple[str, dict[str, str]] | None = None
         self._credentials: dict[str, str] | None = None
         self._permit_media_type_id: str | int | None = None
         self._permit_media_code: str | None = None
         self._api_timezone: ZoneInfo | None = None
+        self._timestamp_cache: dict[str, str] = {}
         self._operation_lock = asyncio.Lock()
         self._lock_owner: asyncio.Task[Any] | None = None
         self._lock_depth = 0
@@ -606,6 +609,10 @@ class Provider(BaseProvider):
         raw = value.strip()
         if raw.endswith("Z"):
             return self._ensure_utc_timestamp(raw)
+        # Reservations and zone blocks share boundaries, so the same local values repeat.
+        cached = self._timestamp_cache.get(raw)
+        if cached is not None:
+            return cached
         try:
             parsed = datetime.fromisoformat(raw)
         except ValueError as exc:
@@ -614,7 +621,11 @@ class Provider(BaseProvider):
             # DVS Portal returns local timestamps without offsets; assume Europe/Amsterdam.
             # Use fold=0 deterministically for DST transitions.
             parsed = parsed.replace(tzinfo=self._provider_timezone(), fold=0)
-        return format_utc_timestamp(parsed)
+        result = format_utc_timestamp(parsed)
+        if len(self._timestamp_cache) >= _TIMESTAMP_CACHE_SIZE:
+            self._timestamp_cache.clear()
+        self._timestamp_cache[raw] = result
+        return result
 
     def _format_provider_timestamp(self, value: datetime) -> str:
         if value.tzinfo is None:
@@ -674,32 +685,39 @@ class Provider(BaseProvider):
         await self._ensure_authenticated()
         if not self._auth_header_value:
             raise AuthError("Authentication required.")
-        headers = {AUTH_HEADER: self._auth_header_value}
         return await self._request_json(
             method,
             path,
             json=json,
-            headers=headers,
+            headers=self._build_auth_headers(),
             allow_reauth=True,
         )
 
+    def _build_auth_headers(self) -> dict[str, str]:
+        # Reuse the merged header dict until the token changes; aiohttp copies it per request.
+        auth_value = self._auth_header_value or ""
+        cached = self._auth_headers_cache
+        if cached is None or cached[0] != auth_value:
+            cached = (auth_value, {**DEFAULT_HEADERS, AUTH_HEADER: auth_value})
+            self._auth_headers_cache = cached
+        return cached[1]
+
     async def _request_json(
         self,
         method: str,
         path: str,
         *,
         json: Any | None = None,
-        headers: dict[str, str] | None = None,
+        headers: Mapping[str, str] | None = None,
         allow_reauth: bool,
     ) -> Any:
         url = self._build_url(path)
-        merged_headers = {**DEFAULT_HEADERS, **(headers or {})}
         return await self._request(
             method,
             url,
             expect_json=True,
             json=json,
-            headers=merged_headers,
+            headers=DEFAULT_HEADERS if headers is None else headers,
             allow_reauth=allow_reauth,
         )
 
@@ -710,7 +728,7 @@ class Provider(BaseProvider):
         *,
         expect_json: bool,
         json: Any,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
         allow_reauth: bool,
     ) -> Any:
         attempts = 2 if allow_reauth else 1
@@ -727,7 +745,7 @@ class Provider(BaseProvider):
                 if allow_reauth and attempt == 0:
                     _LOGGER.warning("Provider %s reauth triggered", self.provider_id)
                     await self._reauthenticate()
-                    headers = {**DEFAULT_HEADERS, AUTH_HEADER: self._auth_header_value or ""}
+                    headers = self._build_auth_headers()
                     continue
                 raise
         raise ProviderError("Request failed.")
@@ -739,7 +757,7 @@ class Provider(BaseProvider):
         *,
         expect_json: bool,
         json: Any,
-        headers: dict[str, str],
+        headers: Mapping[str, str],
     ) -> Any:
         async def handle_response(
             response: aiohttp.ClientResponse,
@@ -1,5 +1,7 @@
 """Constants for the DVS Portal provider."""
 
+from types import MappingProxyType
+
 DEFAULT_API_URI = "/DVSWebAPI/api"
 API_TIMEZONE = "Europe/Amsterdam"
 
@@ -17,7 +19,10 @@ AUTH_HEADER = "Authorization"
 AUTH_PREFIX = "Token "
 RETRY_AFTER_HEADER = "Retry-After"
 
-DEFAULT_HEADERS = {
-    "Accept": "application/json",
-    "User-Agent": "pycityvisitorparking-dvsportal",
-}
+# Read-only: the dict is passed to aiohttp as is and shared by every request.
+DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json",
+        "User-Agent": "pycityvisitorparking-dvsportal",
+    }
+)
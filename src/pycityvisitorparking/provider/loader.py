@@ -20,6 +20,7 @@ SCHEMA_FILENAME = "manifest.schema.json"
 _DEFAULT_CACHE_TTL_SECONDS = 300.0
 _MANIFEST_CACHE: tuple[ProviderManifest, ...] | None = None
 _MANIFEST_CACHE_EXPIRES_AT: float | None = None
+_PROVIDER_INFO_CACHE: tuple[tuple[ProviderManifest, ...], tuple[ProviderInfo, ...]] | None = None
 _FAVORITE_UPDATE_FIELDS = {"license_plate", "name"}
 _RESERVATION_UPDATE_FIELDS = {"start_time", "end_time", "name"}
 _LOGGER = logging.getLogger(__name__)
@@ -176,8 +177,10 @@ def clear_manifest_cache() -> None:
     """Clear cached provider manifests (used in tests)."""
     global _MANIFEST_CACHE
     global _MANIFEST_CACHE_EXPIRES_AT
+    global _PROVIDER_INFO_CACHE
     _MANIFEST_CACHE = None
     _MANIFEST_CACHE_EXPIRES_AT = None
+    _PROVIDER_INFO_CACHE = None
 
 
 def list_providers(
@@ -186,14 +189,23 @@ def list_providers(
     cache_ttl: float | None = _DEFAULT_CACHE_TTL_SECONDS,
 ) -> list[ProviderInfo]:
     """Return provider info entries from cached manifests."""
-    return [
+    global _PROVIDER_INFO_CACHE
+    manifests = load_manifests(refresh=refresh, cache_ttl=cache_ttl)
+    source = _MANIFEST_CACHE
+    cached = _PROVIDER_INFO_CACHE
+    # Reuse the frozen entries while the manifest cache still holds the same tuple.
+    if source is not None and cached is not None and cached[0] is source:
+        return list(cached[1])
+    providers = tuple(
         ProviderInfo(
             id=manifest.id,
             favorite_update_fields=manifest.favorite_update_fields,
             reservation_update_fields=manifest.reservation_update_fields,
         )
-        for manifest in load_manifests(refresh=refresh, cache_ttl=cache_ttl)
-    ]
+        for manifest in manifests
+    )
+    _PROVIDER_INFO_CACHE = (source, providers) if source is not None else None
+    return list(providers)
 
 
 async def async_list_providers(
@@ -74,6 +74,7 @@ class Provider(BaseProvider):
         )
         self._credentials: dict[str, str] | None = None
         self._permit_media_type_id: str | None = None
+        self._headers_cache: tuple[str | None, dict[str, str]] | None = None
         self._logged_in = False
 
     async def login(self, credentials: Mapping[str, str] | None = None, **kwargs: str) -> None:
@@ -425,9 +426,15 @@ class Provider(BaseProvider):
         )
 
     def _build_headers(self) -> dict[str, str]:
+        # Reuse the header dict until the permit media type changes; aiohttp copies it per request.
+        permit_media_type_id = self._permit_media_type_id
+        cached = self._headers_cache
+        if cached is not None and cached[0] == permit_media_type_id:
+            return cached[1]
         headers = dict(DEFAULT_HEADERS)
-        if self._permit_media_type_id:
-            headers[PERMIT_MEDIA_TYPE_HEADER] = self._permit_media_type_id
+        if permit_media_type_id:
+            headers[PERMIT_MEDIA_TYPE_HEADER] = permit_media_type_id
+        self._headers_cache = (permit_media_type_id, headers)
         return headers
 
     async def _request_json(
@@ -1,5 +1,7 @@
 """Constants for The Hague provider."""
 
+from types import MappingProxyType
+
 DEFAULT_API_URI = "/api"
 
 SESSION_ENDPOINT = "/session/0"
@@ -12,8 +14,11 @@ PERMIT_MEDIA_TYPE_HEADER = "x-permit-media-type-id"
 
 DEFAULT_REQUESTED_WITH = "angular"
 
-DEFAULT_HEADERS = {
-    "Accept": "application/json",
-    "User-Agent": "pycityvisitorparking-the-hague",
-    REQUESTED_WITH_HEADER: DEFAULT_REQUESTED_WITH,
-}
+# Read-only: the shared base for the per-provider request header dicts.
+DEFAULT_HEADERS = MappingProxyType(
+    {
+        "Accept": "application/json",
+        "User-Agent": "pycityvisitorparking-the-hague",
+        REQUESTED_WITH_HEADER: DEFAULT_REQUESTED_WITH,
+    }
+)
@@ -1,7 +1,9 @@
+from collections.abc import AsyncIterator
 from datetime import UTC
 
 import aiohttp
 import pytest
+import pytest_asyncio
 
 from pycityvisitorparking.exceptions import ValidationError
 from pycityvisitorparking.models import Favorite, Permit, Reservation, ZoneValidityBlock
@@ -59,26 +61,33 @@ FAVORITE_SAMPLE = {
 }
 
 
+MANIFEST = ProviderManifest(
+    id="the_hague",
+    name="The Hague",
+    favorite_update_fields=("license_plate", "name"),
+    reservation_update_fields=("end_time",),
+)
+
+
+@pytest_asyncio.fixture(loop_scope="module", scope="module")
+async def session() -> AsyncIterator[aiohttp.ClientSession]:
+    async with aiohttp.ClientSession() as client_session:
+        yield client_session
+
+
+@pytest.fixture
+def provider(session: aiohttp.ClientSession) -> Provider:
+    return Provider(session, MANIFEST, base_url="https://example")
+
+
 def assert_utc_timestamp(value: str) -> None:
     parsed = parse_timestamp(value)
     assert parsed.tzinfo == UTC
     assert format_utc_timestamp(parsed) == value
 
 
-@pytest.mark.asyncio
-async def test_map_permit_filters_free_blocks_and_converts_utc():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        permit = provider._map_permit(ACCOUNT_SAMPLE)
+def test_map_permit_filters_free_blocks_and_converts_utc(provider: Provider):
+    permit = provider._map_permit(ACCOUNT_SAMPLE)
 
     assert isinstance(permit, Permit)
     assert permit.id == "42"
@@ -94,20 +103,8 @@ async def test_map_permit_filters_free_blocks_and_converts_utc():
         assert_utc_timestamp(block.end_time)
 
 
-@pytest.mark.asyncio
-async def test_map_permit_uses_zone_when_zone_validity_missing():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        permit = provider._map_permit(ZONE_FALLBACK_SAMPLE)
+def test_map_permit_uses_zone_when_zone_validity_missing(provider: Provider):
+    permit = provider._map_permit(ZONE_FALLBACK_SAMPLE)
 
     assert isinstance(permit, Permit)
     assert permit.zone_validity == [
@@ -121,20 +118,8 @@ async def test_map_permit_uses_zone_when_zone_validity_missing():
         assert_utc_timestamp(block.end_time)
 
 
-@pytest.mark.asyncio
-async def test_map_reservation_normalizes_plate_and_utc():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        reservation = provider._map_reservation(RESERVATION_SAMPLE)
+def test_map_reservation_normalizes_plate_and_utc(provider: Provider):
+    reservation = provider._map_reservation(RESERVATION_SAMPLE)
 
     assert isinstance(reservation, Reservation)
     assert reservation.id == "123"
@@ -146,184 +131,88 @@ async def test_map_reservation_normalizes_plate_and_utc():
     assert_utc_timestamp(reservation.end_time)
 
 
-@pytest.mark.asyncio
-async def test_error_code_mapping():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        message = provider._error_message_for_code("PV00076")
-
-    assert message == "Provider error pv76: No paid parking at this time"
-
-
-@pytest.mark.asyncio
-async def test_error_code_mapping_lowercase_with_zeros():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        message = provider._error_message_for_code("pv00076")
-
-    assert message == "Provider error pv76: No paid parking at this time"
-
-
-@pytest.mark.asyncio
-async def test_error_code_mapping_unknown_code_is_generic():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        message = provider._error_message_for_code("pv999")
-
-    assert message == "Provider error pv999."
-
-
-@pytest.mark.asyncio
-async def test_map_favorite_normalizes_plate():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        favorite = provider._map_favorite(FAVORITE_SAMPLE)
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        pytest.param("PV00076", "Provider error pv76: No paid parking at this time", id="known"),
+        pytest.param(
+            "pv00076",
+            "Provider error pv76: No paid parking at this time",
+            id="lowercase-with-zeros",
+        ),
+        pytest.param("pv999", "Provider error pv999.", id="unknown-is-generic"),
+    ],
+)
+def test_error_code_mapping(provider: Provider, code: str, expected: str):
+    assert provider._error_message_for_code(code) == expected
+
+
+def test_map_favorite_normalizes_plate(provider: Provider):
+    favorite = provider._map_favorite(FAVORITE_SAMPLE)
 
     assert isinstance(favorite, Favorite)
     assert favorite.id == "9"
     assert favorite.name == "Family"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_add_favorite_rejects_duplicate_plate(
+    provider: Provider,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-
-        async def _fake_list_favorites() -> list[Favorite]:
-            return [Favorite(id="9", name="Family", license_plate="AB12CD")]
+    async def _fake_list_favorites() -> list[Favorite]:
+        return [Favorite(id="9", name="Family", license_plate="AB12CD")]
 
-        called = {"request": False}
+    called = {"request": False}
 
-        async def _fake_request_json(
-            method: str,
-            path: str,
-            *,
-            json: object | None = None,
-            allow_reauth: bool,
-        ) -> object:
-            called["request"] = True
-            return {}
+    async def _fake_request_json(
+        method: str,
+        path: str,
+        *,
+        json: object | None = None,
+        allow_reauth: bool,
+    ) -> object:
+        called["request"] = True
+        return {}
 
-        monkeypatch.setattr(provider, "list_favorites", _fake_list_favorites)
-        monkeypatch.setattr(provider, "_request_json", _fake_request_json)
+    monkeypatch.setattr(provider, "list_favorites", _fake_list_favorites)
+    monkeypatch.setattr(provider, "_request_json", _fake_request_json)
 
-        with pytest.raises(ValidationError):
-            await provider.add_favorite("ab-12 cd", name="Other")
+    with pytest.raises(ValidationError):
+        await provider.add_favorite("ab-12 cd", name="Other")
 
     assert called["request"] is False
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_request_includes_permit_media_type_header(
+    provider: Provider,
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
-        provider._permit_media_type_id = "1"
-        captured: dict[str, dict[str, str]] = {}
+    provider._permit_media_type_id = "1"
+    captured: dict[str, dict[str, str]] = {}
 
-        async def _fake_request(
-            method: str, url: str, *, expect_json: bool, **kwargs: object
-        ) -> object:
-            headers = kwargs.get("headers")
-            if isinstance(headers, dict):
-                captured["headers"] = headers
-            return {}
+    async def _fake_request(
+        method: str, url: str, *, expect_json: bool, **kwargs: object
+    ) -> object:
+        headers = kwargs.get("headers")
+        if isinstance(headers, dict):
+            captured["headers"] = headers
+        return {}
 
-        monkeypatch.setattr(provider, "_request", _fake_request)
-        await provider._request_json("GET", "/noop", allow_reauth=False)
+    monkeypatch.setattr(provider, "_request", _fake_request)
+    await provider._request_json("GET", "/noop", allow_reauth=False)
 
     headers = captured["headers"]
     assert headers[PERMIT_MEDIA_TYPE_HEADER] == "1"
 
 
-@pytest.mark.asyncio
-async def test_login_requires_username():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
+@pytest.mark.asyncio(loop_scope="module")
+async def test_login_requires_username(provider: Provider):
+    with pytest.raises(ValidationError):
+        await provider.login(credentials={"password": "secret"})
 
-        with pytest.raises(ValidationError):
-            await provider.login(credentials={"password": "secret"})
-
-
-@pytest.mark.asyncio
-async def test_default_api_uri_is_applied():
-    async with aiohttp.ClientSession() as session:
-        provider = Provider(
-            session,
-            ProviderManifest(
-                id="the_hague",
-                name="The Hague",
-                favorite_update_fields=("license_plate", "name"),
-                reservation_update_fields=("end_time",),
-            ),
-            base_url="https://example",
-        )
 
-        expected = f"https://example{DEFAULT_API_URI}{SESSION_ENDPOINT}"
-        assert provider._build_url(SESSION_ENDPOINT) == expected
+def test_default_api_uri_is_applied(provider: Provider):
+    expected = f"https://example{DEFAULT_API_URI}{SESSION_ENDPOINT}"
+    assert provider._build_url(SESSION_ENDPOINT) == expected
@@ -5,18 +5,35 @@ from __future__ import annotations
 import re
 from collections.abc import Iterable
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Literal, overload
 
 from .exceptions import ValidationError
 from .models import ZoneValidityBlock
 
 _LICENSE_PLATE_RE = re.compile(r"[^A-Z0-9]")
+# Bytes dropped from ASCII plates: everything except A-Z and 0-9.
+_LICENSE_PLATE_DELETE = bytes(
+    code for code in range(256) if not ("0" <= chr(code) <= "9" or "A" <= chr(code) <= "Z")
+)
+# The library's own output format; provider payloads usually already use it.
+_CANONICAL_UTC_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}Z")
 
 
 def normalize_license_plate(plate: str) -> str:
     if not isinstance(plate, str):
         raise ValidationError("License plate must be a string.")
-    normalized = _LICENSE_PLATE_RE.sub("", plate.upper())
+    return _normalize_plate_text(plate)
+
+
+@lru_cache(maxsize=256)
+def _normalize_plate_text(plate: str) -> str:
+    # Write paths normalize the input and again the echoed response; plates repeat.
+    upper = plate.upper()
+    if upper.isascii():
+        normalized = upper.encode("ascii").translate(None, _LICENSE_PLATE_DELETE).decode("ascii")
+    else:
+        normalized = _LICENSE_PLATE_RE.sub("", upper)
     if not normalized:
         raise ValidationError("License plate is empty after normalization.")
     return normalized
@@ -51,6 +68,13 @@ def format_utc_timestamp(value: datetime) -> str:
 
 
 def ensure_utc_timestamp(value: str) -> str:
+    if isinstance(value, str) and _CANONICAL_UTC_RE.fullmatch(value):
+        # Already canonical; only confirm the fields are in range.
+        try:
+            datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise ValidationError("Timestamp is not a valid ISO 8601 value.") from exc
+        return value
     normalized = parse_timestamp(value)
     return normalized.isoformat().replace("+00:00", "Z")
 
@@ -171,6 +171,21 @@ def test_filter_chargeable_zone_validity_invalid() -> None:
         provider._filter_chargeable_zone_validity(blocks)
 
 
+def test_filter_chargeable_zone_validity_normalizes_chargeable_blocks() -> None:
+    provider = _DummyProvider(_SequenceSession([]), _manifest(), base_url="https://example.com")
+    canonical = ZoneValidityBlock("2024-01-01T08:00:00Z", "2024-01-01T10:00:00Z")
+    offset = ZoneValidityBlock("2024-01-01T12:00:00+01:00", "2024-01-01T13:00:00+01:00")
+    free = ZoneValidityBlock("2024-01-01T18:00:00Z", "2024-01-01T20:00:00Z")
+
+    result = provider._filter_chargeable_zone_validity(
+        iter([(canonical, True), (free, False), (offset, True)])
+    )
+
+    assert result[0] is canonical
+    assert result[1] == ZoneValidityBlock("2024-01-01T11:00:00Z", "2024-01-01T12:00:00Z")
+    assert len(result) == 2
+
+
 @pytest.mark.asyncio
 async def test_update_favorite_not_supported() -> None:
     provider = _DummyProvider(_SequenceSession([]), _manifest(), base_url="https://example.com")
@@ -1,3 +1,6 @@
+import subprocess
+import sys
+
 import aiohttp
 import pytest
 
@@ -12,3 +15,43 @@ async def test_client_does_not_close_injected_session() -> None:
 
     assert session.closed is False
     await session.close()
+
+
+@pytest.mark.asyncio
+async def test_client_shares_internal_session_across_providers() -> None:
+    async with Client(base_url="https://example") as client:
+        first = await client.get_provider("dvsportal")
+        second = await client.get_provider("the_hague")
+        session = first._session
+
+        assert session is second._session
+        assert session.closed is False
+
+    assert session.closed is True
+
+
+@pytest.mark.asyncio
+async def test_client_internal_session_tunes_connector(monkeypatch: pytest.MonkeyPatch) -> None:
+    captured: dict[str, object] = {}
+    original = aiohttp.TCPConnector
+
+    def fake_connector(**kwargs: object) -> aiohttp.TCPConnector:
+        captured.update(kwargs)
+        return original(**kwargs)
+
+    monkeypatch.setattr(aiohttp, "TCPConnector", fake_connector)
+
+    async with Client():
+        pass
+
+    assert captured == {"keepalive_timeout": 30.0, "ttl_dns_cache": 300}
+
+
+def test_package_import_defers_client_and_aiohttp() -> None:
+    code = (
+        "import sys, pycityvisitorparking as pkg; "
+        "assert 'aiohttp' not in sys.modules; "
+        "assert pkg.Client.__name__ == 'Client'; "
+        "assert 'aiohttp' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -10,7 +10,12 @@ import pytest
 from pycityvisitorparking.exceptions import AuthError, NetworkError, ProviderError, ValidationError
 from pycityvisitorparking.models import ZoneValidityBlock
 from pycityvisitorparking.provider.dvsportal.api import Provider
-from pycityvisitorparking.provider.dvsportal.const import AUTH_PREFIX, RETRY_AFTER_HEADER
+from pycityvisitorparking.provider.dvsportal.const import (
+    AUTH_HEADER,
+    AUTH_PREFIX,
+    DEFAULT_HEADERS,
+    RETRY_AFTER_HEADER,
+)
 from pycityvisitorparking.provider.loader import ProviderManifest
 
 
@@ -118,6 +123,24 @@ def test_build_auth_header() -> None:
     assert provider._build_auth_header(token) == f"{AUTH_PREFIX}{encoded}"
 
 
+def test_default_headers_are_read_only() -> None:
+    with pytest.raises(TypeError):
+        DEFAULT_HEADERS["Accept"] = "text/html"  # type: ignore[index]
+
+
+def test_build_auth_headers_reused_until_token_changes() -> None:
+    provider = _provider(_SequenceSession([]))
+    provider._auth_header_value = "Token first"
+    first = provider._build_auth_headers()
+    assert provider._build_auth_headers() is first
+    assert first[AUTH_HEADER] == "Token first"
+
+    provider._auth_header_value = "Token second"
+    second = provider._build_auth_headers()
+    assert second is not first
+    assert second[AUTH_HEADER] == "Token second"
+
+
 def test_cache_defaults_sets_media_fields() -> None:
     provider = _provider(_SequenceSession([]))
     permit = {"PermitMedias": [{"TypeID": 7, "Code": " CODE "}]}
@@ -566,3 +589,14 @@ async def test_parse_provider_timestamp_handles_local_time() -> None:
     provider = _provider(_SequenceSession([]))
     timestamp = provider._parse_provider_timestamp("2024-01-01T10:00:00")
     assert timestamp == "2024-01-01T09:00:00Z"
+
+
+def test_parse_provider_timestamp_reuses_cached_value(monkeypatch: pytest.MonkeyPatch) -> None:
+    provider = _provider(_SequenceSession([]))
+    assert provider._parse_provider_timestamp("2024-01-01T10:00:00") == "2024-01-01T09:00:00Z"
+
+    def _fail() -> None:
+        raise AssertionError("timezone lookup should be skipped on a cache hit")
+
+    monkeypatch.setattr(provider, "_provider_timezone", _fail)
+    assert provider._parse_provider_timestamp(" 2024-01-01T10:00:00 ") == "2024-01-01T09:00:00Z"
@@ -1,3 +1,5 @@
+import pickle
+
 from pycityvisitorparking.exceptions import (
     AuthError,
     ConfigError,
@@ -40,6 +42,15 @@ def test_error_overrides() -> None:
     assert exc.user_message == "Network issue. Please try again later."
 
 
+def test_error_metadata_survives_pickle() -> None:
+    exc = RateLimitError(detail="slow down", user_message="Try again later.")
+    restored = pickle.loads(pickle.dumps(exc))
+    assert str(restored) == "slow down"
+    assert restored.error_code == "rate_limit"
+    assert restored.detail == "slow down"
+    assert restored.user_message == "Try again later."
+
+
 def test_error_types_have_codes() -> None:
     assert AuthError("nope").error_code == "auth_error"
     assert NetworkError("nope").error_code == "network_error"
@@ -53,3 +53,21 @@ async def test_get_provider_uses_to_thread(monkeypatch: pytest.MonkeyPatch) -> N
 
     assert calls["count"] == 1
     assert provider.provider_id == "dvsportal"
+
+
+def test_load_provider_data_caches_provider_class(monkeypatch: pytest.MonkeyPatch) -> None:
+    client_module._load_provider_class.cache_clear()
+    calls = {"count": 0}
+    original = client_module.importlib.import_module
+
+    def wrapped(name: str):
+        calls["count"] += 1
+        return original(name)
+
+    monkeypatch.setattr(client_module.importlib, "import_module", wrapped)
+
+    _, first = client_module._load_provider_data("dvsportal")
+    _, second = client_module._load_provider_data("dvsportal")
+
+    assert calls["count"] == 1
+    assert first is second
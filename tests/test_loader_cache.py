@@ -75,3 +75,16 @@ async def test_async_load_manifests_uses_to_thread(monkeypatch: pytest.MonkeyPat
     await loader_module.async_load_manifests()
 
     assert calls["count"] == 1
+
+
+def test_list_providers_reuses_entries_while_cached() -> None:
+    loader_module.clear_manifest_cache()
+
+    first = loader_module.list_providers()
+    second = loader_module.list_providers()
+    refreshed = loader_module.list_providers(refresh=True)
+
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+    assert refreshed == first
+    assert all(a is not b for a, b in zip(first, refreshed, strict=True))
@@ -0,0 +1,64 @@
+import importlib.util
+import io
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+_SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "sanitize.py"
+
+
+@pytest.fixture(scope="module")
+def sanitize():
+    spec = importlib.util.spec_from_file_location("sanitize_script", _SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+        yield module
+    finally:
+        sys.modules.pop(spec.name, None)
+
+
+def _written(sanitize, data) -> str:
+    handle = io.StringIO()
+    sanitize._write_json(data, handle, ndjson=False, indent=2)
+    return handle.getvalue()
+
+
+def test_write_json_sorts_nested_plate_dicts(sanitize) -> None:
+    payload = {
+        "LicensePlate": {"Value": "AB12CD", "DisplayValue": "AB-12-CD", "Zeta": 1},
+        "Permits": [{"b": 1, "a": {"y": 2, "x": 3}}],
+    }
+
+    data = sanitize.sanitize_data(payload)
+    output = _written(sanitize, data)
+
+    assert output == json.dumps(data, indent=2, sort_keys=True, ensure_ascii=True)
+    assert list(data["LicensePlate"]) == ["DisplayValue", "Value", "Zeta"]
+
+
+def test_sanitize_headers_sorts_keys(sanitize) -> None:
+    headers = sanitize.sanitize_headers({"X-Trace": "1", "Authorization": "Token abc"})
+
+    assert list(headers) == ["Authorization", "X-Trace"]
+    assert headers["Authorization"] != "Token abc"
+
+
+def test_batch_in_place_reports_unreadable_path(sanitize, tmp_path, monkeypatch, capsys) -> None:
+    good = tmp_path / "good.json"
+    good.write_text(json.dumps({"password": "secret"}), encoding="utf-8")
+    # A directory passes the existence check in main() but fails to open as a file.
+    unreadable = tmp_path / "unreadable.json"
+    unreadable.mkdir()
+    # Threads keep the worker importable from this path-loaded module.
+    monkeypatch.setattr(sanitize, "ProcessPoolExecutor", ThreadPoolExecutor)
+    monkeypatch.setattr(sys, "argv", ["sanitize.py", "--in-place", str(good), str(unreadable)])
+
+    assert sanitize.main() == 2
+    assert json.loads(good.read_text(encoding="utf-8"))["password"] != "secret"
+    assert str(unreadable) in capsys.readouterr().err
@@ -102,6 +102,18 @@ def test_build_headers_includes_permit_media_type() -> None:
     assert headers[PERMIT_MEDIA_TYPE_HEADER] == "ABC"
 
 
+def test_build_headers_reused_until_permit_media_type_changes() -> None:
+    provider = _provider()
+    first = provider._build_headers()
+    assert provider._build_headers() is first
+    assert PERMIT_MEDIA_TYPE_HEADER not in first
+
+    provider._permit_media_type_id = "ABC"
+    second = provider._build_headers()
+    assert second is not first
+    assert second[PERMIT_MEDIA_TYPE_HEADER] == "ABC"
+
+
 @pytest.mark.asyncio
 async def test_error_message_from_response_uses_description() -> None:
     provider = _provider()
@@ -18,11 +18,24 @@ def test_normalize_license_plate() -> None:
     assert normalize_license_plate(" ab-12 cd ") == "AB12CD"
 
 
+def test_normalize_license_plate_drops_non_ascii() -> None:
+    assert normalize_license_plate("xé-12 ÿz") == "X12Z"
+
+
 def test_normalize_license_plate_invalid() -> None:
     with pytest.raises(ValidationError):
         normalize_license_plate("!!!")
 
 
+def test_normalize_license_plate_repeats_consistently() -> None:
+    assert normalize_license_plate("ab-12") == normalize_license_plate("ab-12") == "AB12"
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            normalize_license_plate("--")
+    with pytest.raises(ValidationError):
+        normalize_license_plate(["AB12"])  # type: ignore[arg-type]
+
+
 def test_format_utc_timestamp_converts_offset() -> None:
     dt = datetime(2024, 1, 1, 12, 0, tzinfo=timezone(timedelta(hours=2)))
     assert format_utc_timestamp(dt) == "2024-01-01T10:00:00Z"
@@ -32,6 +45,13 @@ def test_ensure_utc_timestamp() -> None:
     assert ensure_utc_timestamp("2024-01-01T12:00:00+02:00") == "2024-01-01T10:00:00Z"
 
 
+def test_ensure_utc_timestamp_keeps_canonical_value() -> None:
+    assert ensure_utc_timestamp("2024-01-01T10:00:00Z") == "2024-01-01T10:00:00Z"
+    assert ensure_utc_timestamp("2024-01-01T10:00:00.5Z") == "2024-01-01T10:00:00Z"
+    with pytest.raises(ValidationError):
+        ensure_utc_timestamp("2024-13-01T10:00:00Z")
+
+
 def test_ensure_utc_timestamp_rejects_naive_datetime() -> None:
     with pytest.raises(ValidationError):
         ensure_utc_timestamp(datetime(2024, 1, 1, 12, 0))